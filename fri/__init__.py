@@ -47,6 +47,18 @@ LUPI_MODELS = [
     ProblemName.LUPI_REGRESSION,
     ProblemName.LUPI_ORDREGRESSION,
 ]
+# Lookup of string names accepted by `FRI`, full enum names and common abbreviations
+_PROBLEM_NAME_STRINGS = {enum.name.lower(): enum for enum in ProblemName}
+_PROBLEM_NAME_STRINGS.update(
+    {
+        "class": ProblemName.CLASSIFICATION,
+        "reg": ProblemName.REGRESSION,
+        "ordreg": ProblemName.ORDINALREGRESSION,
+        "lupi_class": ProblemName.LUPI_CLASSIFICATION,
+        "lupi_reg": ProblemName.LUPI_REGRESSION,
+        "lupi_ordreg": ProblemName.LUPI_ORDREGRESSION,
+    }
+)
 from arfs_gen import genRegressionData, genClassificationData, genOrdinalRegressionData
 
 
@@ -76,6 +88,8 @@ class FRI(FRIBase):
         w_l1_slack: float = 0.001,
         loss_slack: float = 0.001,
         normalize: bool = True,
+        halving_search: bool = False,
+        solver: str = "ECOS",
         **kwargs,
     ):
         """
@@ -101,21 +115,21 @@ class FRI(FRIBase):
             Allow deviation of loss.
         normalize: boolean
             Normalize relevace bounds to range of [0,1] depending on L1 norm.
+        halving_search: boolean
+            Use successive halving in the hyperparameter search, which evaluates most candidates only on subsets of the data.
+            Not supported for LUPI models.
+        solver: str
+            Name of the cvxpy solver used for the relevance bound problems, e.g. "ECOS" or "CLARABEL".
 
         """
         self.problemName = problemName
 
         if isinstance(problemName, ProblemName):
             problemtype = problemName.value
+        elif problemName in _PROBLEM_NAME_STRINGS:
+            problemtype = _PROBLEM_NAME_STRINGS[problemName].value
         else:
-            if problemName == "classification" or problemName == "class":
-                problemtype = ProblemName.CLASSIFICATION
-            elif problemName == "regression" or problemName == "reg":
-                problemtype = ProblemName.REGRESSION
-            elif problemName == "ordinalregression" or problemName == "ordreg":
-                problemtype = ProblemName.ORDINALREGRESSION
-            elif problemName == "lupi_classification" or problemName == "lupi_class":
-                problemtype = ProblemName.LUPI_CLASSIFICATION
+            problemtype = None
 
         if problemtype is None:
             names = [enum.name.lower() for enum in ProblemName]
@@ -134,6 +148,8 @@ class FRI(FRIBase):
                 w_l1_slack=w_l1_slack,
                 loss_slack=loss_slack,
                 normalize=normalize,
+                halving_search=halving_search,
+                solver=solver,
                 **kwargs,
             )
 
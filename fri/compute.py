@@ -1,6 +1,7 @@
 """This module includes all important computation functions which are used internally.
 They (normally) should not be used by users.
 """
+import itertools
 import logging
 from collections import defaultdict
 
@@ -14,18 +15,18 @@ from scipy.cluster.hierarchy import fcluster, linkage
 from fri.model.base_cvxproblem import Relevance_CVXProblem
 from fri.model.base_initmodel import InitModel
 from fri.model.base_type import ProblemType
-from fri.utils import permutate_feature_in_data
+from fri.utils import permutate_feature_in_data, worker_backend
 
 from .utils import distance
 
 MIN_N_PROBE_FEATURES = 20  # Lower bound of probe features
 
 
-def _start_solver_worker(bound: Relevance_CVXProblem):
+def _start_solver_worker(bound: Relevance_CVXProblem, solver="ECOS"):
     """
     Worker thread method for parallel computation
     """
-    return bound.solve()
+    return bound.solve(solver=solver)
 
 
 class RelevanceBoundsIntervals(object):
@@ -39,8 +40,11 @@ class RelevanceBoundsIntervals(object):
         n_jobs,
         verbose,
         normalize=True,
+        solver="ECOS",
     ):
-        self.data = data
+        # cvxpy works on float64 data, convert once here instead of in every single bound problem
+        X, y = data
+        self.data = (np.ascontiguousarray(X, dtype=np.float64), y)
         self.problem_type = problem_type
         self.verbose = verbose
         self.n_jobs = n_jobs
@@ -49,13 +53,24 @@ class RelevanceBoundsIntervals(object):
         self.best_init_model = best_init_model
         self.best_hyperparameters = best_init_model.get_params()
         self.normalize = normalize
+        self.solver = solver
 
         # Relax constraints to improve stability
         self.init_constraints = problem_type.get_relaxed_constraints(
             best_init_model.constraints
         )
 
-    def get_normalized_lupi_intervals(self, lupi_features, presetModel=None):
+    def get_normalized_lupi_intervals(
+        self, lupi_features, presetModel=None, parallel=None
+    ):
+        # Reuse the worker pool of the caller if available, otherwise open our own
+        if parallel is None:
+            with worker_backend(), joblib.Parallel(
+                n_jobs=self.n_jobs, verbose=self.verbose
+            ) as parallel:
+                return self.get_normalized_lupi_intervals(
+                    lupi_features, presetModel=presetModel, parallel=parallel
+                )
 
         # We define a list of all the features we want to compute relevance bounds for
         X, _ = self.data  # TODO: handle other data formats
@@ -63,16 +78,17 @@ class RelevanceBoundsIntervals(object):
         normal_d = all_d - lupi_features
 
         # Compute relevance bounds and probes for normal features and LUPI
-        with joblib.Parallel(n_jobs=self.n_jobs, verbose=self.verbose) as parallel:
-            d_n = _get_necessary_dimensions(normal_d, presetModel)
-            rb = self.compute_relevance_bounds(d_n, parallel=parallel)
-            probe_upper = self.compute_probe_values(d_n, True, parallel=parallel)
-            probe_lower = self.compute_probe_values(d_n, False, parallel=parallel)
+        d_n = _get_necessary_dimensions(normal_d, presetModel)
+        rb, probe_upper, probe_lower = self.compute_relevance_bounds_and_probes(
+            d_n, parallel=parallel
+        )
 
-            d_l = _get_necessary_dimensions(all_d, presetModel, start=normal_d)
-            rb_l = self.compute_relevance_bounds(d_l, parallel=parallel)
-            probe_priv_upper = self.compute_probe_values(d_l, True, parallel=parallel)
-            probe_priv_lower = self.compute_probe_values(d_l, False, parallel=parallel)
+        d_l = _get_necessary_dimensions(all_d, presetModel, start=normal_d)
+        (
+            rb_l,
+            probe_priv_upper,
+            probe_priv_lower,
+        ) = self.compute_relevance_bounds_and_probes(d_l, parallel=parallel)
 
         #
         # Postprocess
@@ -111,7 +127,16 @@ class RelevanceBoundsIntervals(object):
 
         return interval_, fc_both
 
-    def get_normalized_intervals(self, presetModel=None):
+    def get_normalized_intervals(self, presetModel=None, parallel=None):
+        # Reuse the worker pool of the caller if available, otherwise open our own
+        if parallel is None:
+            with worker_backend(), joblib.Parallel(
+                n_jobs=self.n_jobs, verbose=self.verbose
+            ) as parallel:
+                return self.get_normalized_intervals(
+                    presetModel=presetModel, parallel=parallel
+                )
+
         # We define a list of all the features we want to compute relevance bounds for
         X, _ = self.data
         d = X.shape[1]
@@ -119,16 +144,13 @@ class RelevanceBoundsIntervals(object):
         # e.g. in the case of fixed features we skip those
         dims = _get_necessary_dimensions(d, presetModel)
 
-        with joblib.Parallel(n_jobs=self.n_jobs, verbose=self.verbose) as parallel:
-            relevance_bounds = self.compute_relevance_bounds(
-                dims, parallel=parallel, presetModel=presetModel
-            )
-            probe_values_upper = self.compute_probe_values(
-                dims, isUpper=True, parallel=parallel, presetModel=presetModel
-            )
-            probe_values_lower = self.compute_probe_values(
-                dims, isUpper=False, parallel=parallel, presetModel=presetModel
-            )
+        (
+            relevance_bounds,
+            probe_values_upper,
+            probe_values_lower,
+        ) = self.compute_relevance_bounds_and_probes(
+            dims, parallel=parallel, presetModel=presetModel
+        )
 
         # Postprocess bounds
         norm_bounds = self._postprocessing(
@@ -147,20 +169,75 @@ class RelevanceBoundsIntervals(object):
         feature_classes = self.f_classifier.classify(norm_bounds)
         return norm_bounds, feature_classes
 
-    def compute_relevance_bounds(
-        self, dims, parallel=None, presetModel=None, solverargs=None
+    def compute_relevance_bounds_and_probes(
+        self, dims, parallel=None, presetModel=None
     ):
+        """
+        Computes relevance bounds and the upper and lower probe values for `dims`.
+        All problems are handed to the workers in one batch,
+        which avoids idle workers at the end of three separate batches.
+
+        Returns
+        -------
+        tuple
+            relevance bounds, upper probe values, lower probe values
+        """
         init_model_state = self.best_init_model.model_state
 
-        work_queue = self._generate_relevance_bounds_tasks(
-            dims, self.data, presetModel, init_model_state
+        bound_tasks = list(
+            self._generate_relevance_bounds_tasks(
+                dims, self.data, presetModel, init_model_state
+            )
         )
+        upper_probe_tasks = list(
+            self._generate_probe_value_tasks(
+                self.data,
+                dims,
+                True,
+                self.n_resampling,
+                self.random_state,
+                presetModel,
+                init_model_state,
+            )
+        )
+        lower_probe_tasks = list(
+            self._generate_probe_value_tasks(
+                self.data,
+                dims,
+                False,
+                self.n_resampling,
+                self.random_state,
+                presetModel,
+                init_model_state,
+            )
+        )
+        work_queue = itertools.chain(bound_tasks, upper_probe_tasks, lower_probe_tasks)
 
-        # Solve relevance bounds in parallel (when available)
+        # Solve all problems in parallel (when available)
         if parallel is None:
             parallel = joblib.Parallel(n_jobs=self.n_jobs, verbose=self.verbose)
-        bound_results = parallel(map(joblib.delayed(_start_solver_worker), work_queue))
+        results = parallel(self._solver_tasks(work_queue))
+
+        # Split results into their original batches, joblib keeps the order of the tasks
+        n_bounds = len(bound_tasks)
+        n_upper = n_bounds + len(upper_probe_tasks)
+        bound_results = results[:n_bounds]
+        upper_probe_results = results[n_bounds:n_upper]
+        lower_probe_results = results[n_upper:]
+
+        return (
+            self._aggregate_relevance_bounds(dims, bound_results, presetModel),
+            self._aggregate_probe_values(upper_probe_results, isUpper=True),
+            self._aggregate_probe_values(lower_probe_results, isUpper=False),
+        )
 
+    def _solver_tasks(self, problems):
+        return (
+            joblib.delayed(_start_solver_worker)(problem, self.solver)
+            for problem in problems
+        )
+
+    def _aggregate_relevance_bounds(self, dims, bound_results, presetModel=None):
         # Retrieve results and aggregate values in dict
         solved_bounds = defaultdict(list)
         for finished_bound in bound_results:
@@ -179,49 +256,24 @@ class RelevanceBoundsIntervals(object):
 
         return intervals
 
-    def compute_probe_values(self, dims, isUpper=True, parallel=None, presetModel=None):
-        # Get model parameters
-        init_model_state = self.best_init_model.model_state
-
-        # Prepare parallel framework
-        if parallel is None:
-            parallel = joblib.Parallel(n_jobs=self.n_jobs, verbose=self.verbose)
-
-        # Generate
-        probe_queue = self._generate_probe_value_tasks(
-            self.data,
-            dims,
-            isUpper,
-            self.n_resampling,
-            self.random_state,
-            presetModel,
-            init_model_state,
-        )
-        # Compute solution
-        probe_results = parallel(map(joblib.delayed(_start_solver_worker), probe_queue))
-        # probe_values.extend([probe.objective.value for probe in probe_results if probe.is_solved])
-
+    def _aggregate_probe_values(self, probe_results, isUpper):
         candidates = defaultdict(list)
         for candidate in probe_results:
             # Only add bounds with feasible solutions
             if candidate.is_solved:
                 candidates[candidate.probeID].append(candidate)
-        probe_values = []
-        for probes_for_ID in candidates.values():
-            if isUpper:
-                probe_values.append(
-                    self.problem_type.get_cvxproblem_template.aggregate_max_candidates(
-                        probes_for_ID
-                    )
-                )
-            else:
-                probe_values.append(
-                    self.problem_type.get_cvxproblem_template.aggregate_min_candidates(
-                        probes_for_ID
-                    )
-                )
+        template = self.problem_type.get_cvxproblem_template
+        if isUpper:
+            aggregate = template.aggregate_max_candidates
+        else:
+            aggregate = template.aggregate_min_candidates
+        probe_values = np.fromiter(
+            (aggregate(probes_for_ID) for probes_for_ID in candidates.values()),
+            dtype=float,
+            count=len(candidates),
+        )
 
-        return np.array(probe_values)
+        return probe_values
 
     def _generate_relevance_bounds_tasks(
         self, dims, data, preset_model=None, best_model_state=None
@@ -318,7 +370,7 @@ class RelevanceBoundsIntervals(object):
         return lower_bound, upper_bound
 
     def compute_single_preset_relevance_bounds(
-        self, i: int, signed_preset_i: [float, float]
+        self, i: int, signed_preset_i: [float, float], parallel=None
     ):
         """
         Method to run method once for one restricted feature
@@ -328,21 +380,29 @@ class RelevanceBoundsIntervals(object):
             restricted feature
         signed_preset_i:
             restricted range of feature i (set before optimization = preset)
+        parallel:
+            optional `joblib.Parallel` instance whose workers are reused
 
         """
         preset = {i: signed_preset_i}
 
-        rangevector = self.compute_multi_preset_relevance_bounds(preset)
+        rangevector = self.compute_multi_preset_relevance_bounds(
+            preset, parallel=parallel
+        )
 
         return rangevector
 
-    def compute_multi_preset_relevance_bounds(self, preset, lupi_features=0):
+    def compute_multi_preset_relevance_bounds(
+        self, preset, lupi_features=0, parallel=None
+    ):
         """
         Method to run method with preset values
 
         Parameters
         ----------
         lupi_features
+        parallel
+            optional `joblib.Parallel` instance whose workers are reused
         """
 
         # The user is working with normalized values while we compute them unscaled
@@ -358,10 +418,12 @@ class RelevanceBoundsIntervals(object):
         # Calculate all bounds with feature i set to min_i
         if lupi_features > 0:
             rangevector, _ = self.get_normalized_lupi_intervals(
-                lupi_features, presetModel=preset
+                lupi_features, presetModel=preset, parallel=parallel
             )
         else:
-            rangevector, _ = self.get_normalized_intervals(presetModel=preset)
+            rangevector, _ = self.get_normalized_intervals(
+                presetModel=preset, parallel=parallel
+            )
 
         return rangevector
 
@@ -405,7 +467,8 @@ class RelevanceBoundsIntervals(object):
     def _postprocessing(self, L1, rangevector, round_to_zero=True):
         if self.normalize:
             assert L1 > 0
-            rangevector = rangevector.copy() / L1
+            # The division already returns a new array, no need to copy beforehand
+            rangevector = np.divide(rangevector, L1)
 
         if round_to_zero:
             rangevector[rangevector <= 1e-11] = 0
@@ -433,38 +496,49 @@ class RelevanceBoundsIntervals(object):
         d = len(interval)
 
         # Init arrays
-        interval_constrained_to_min = np.zeros(
+        interval_constrained_to_min = np.empty(
             (d, d, 2)
         )  # Save ranges (d,2-dim) for every contrained run (d-times)
-        absolute_delta_bounds_summed_min = np.zeros((d, d, 2))
-        interval_constrained_to_max = np.zeros(
+        interval_constrained_to_max = np.empty(
             (d, d, 2)
         )  # Save ranges (d,2-dim) for every contrained run (d-times)
-        absolute_delta_bounds_summed_max = np.zeros((d, d, 2))
 
         # Set weight for each dimension to minimum and maximum possible value and run optimization of all others
-        # We retrieve the relevance bounds and calculate the absolute difference between them and non-constrained bounds
-        for i in range(d):
-            # min
-            lowb = interval[i, 0]
-            ranges = self.compute_single_preset_relevance_bounds(i, [lowb, lowb])
-            diff = interval - ranges
-            diff[i] = 0
-            interval_constrained_to_min[i] = ranges
-            absolute_delta_bounds_summed_min[i] = diff
-
-            # max
-            highb = interval[i, 1]
-            ranges = self.compute_single_preset_relevance_bounds(i, [highb, highb])
-            diff = interval - ranges
-            diff[i] = 0
-            interval_constrained_to_max[i] = ranges
-            absolute_delta_bounds_summed_max[i] = diff
-
-        feature_points = np.zeros((d, 2 * d * 2))
-        for i in range(d):
-            feature_points[i, : (2 * d)] = absolute_delta_bounds_summed_min[i].flatten()
-            feature_points[i, (2 * d) :] = absolute_delta_bounds_summed_max[i].flatten()
+        # All 2*d preset runs share one pool of workers
+        with worker_backend(), joblib.Parallel(
+            n_jobs=self.n_jobs, verbose=self.verbose
+        ) as parallel:
+            for i in range(d):
+                # min
+                lowb = interval[i, 0]
+                ranges = self.compute_single_preset_relevance_bounds(
+                    i, [lowb, lowb], parallel=parallel
+                )
+                interval_constrained_to_min[i] = ranges
+
+                # max
+                highb = interval[i, 1]
+                if highb != lowb:
+                    ranges = self.compute_single_preset_relevance_bounds(
+                        i, [highb, highb], parallel=parallel
+                    )
+                # Degenerate intervals (e.g. irrelevant features at 0) give the same preset twice, reuse the min run
+                interval_constrained_to_max[i] = ranges
+
+        # We calculate the absolute difference between the constrained and non-constrained bounds
+        # The constrained feature itself does not count
+        absolute_delta_bounds_summed_min = interval - interval_constrained_to_min
+        absolute_delta_bounds_summed_max = interval - interval_constrained_to_max
+        diagonal = np.arange(d)
+        absolute_delta_bounds_summed_min[diagonal, diagonal] = 0
+        absolute_delta_bounds_summed_max[diagonal, diagonal] = 0
+
+        feature_points = np.hstack(
+            [
+                absolute_delta_bounds_summed_min.reshape(d, 2 * d),
+                absolute_delta_bounds_summed_max.reshape(d, 2 * d),
+            ]
+        )
 
         self.relevance_variance = feature_points
 
@@ -515,10 +589,9 @@ class FeatureClassifier:
         """
         weakly = relevance_bounds[:, 1] > self.upper_stat.upper_threshold
         strongly = relevance_bounds[:, 0] > self.lower_stat.upper_threshold
-        both = np.logical_and(weakly, strongly)
-        prediction = np.zeros(relevance_bounds.shape[0], dtype=np.int)
-        prediction[weakly] = 1
-        prediction[both] = 2
+        # 0: irrelevant, 1: weakly relevant, 2: strongly relevant (needs both)
+        prediction = weakly.astype(int)
+        prediction += weakly & strongly
         return prediction
 
 
@@ -557,6 +630,8 @@ def create_probe_statistic(probe_values, fpr, verbose=0):
         probe_values = np.asarray(probe_values)
         mean = probe_values.mean()
         s = probe_values.std()
-        low_t = mean + stats.t(df=n - 1).ppf(fpr) * s * np.sqrt(1 + (1 / n))
-        up_t = mean - stats.t(df=n - 1).ppf(fpr) * s * np.sqrt(1 + (1 / n))
+        # Half width of the prediction interval, symmetric around the mean
+        margin = stats.t.ppf(fpr, df=n - 1) * s * np.sqrt(1 + (1 / n))
+        low_t = mean + margin
+        up_t = mean - margin
     return ProbeStatistic(low_t, up_t, n)
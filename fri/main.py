@@ -1,3 +1,5 @@
+import cvxpy as cvx
+import numpy as np
 from sklearn.base import BaseEstimator
 from sklearn.exceptions import NotFittedError
 
@@ -29,6 +31,8 @@ class FRIBase(BaseEstimator, SelectorMixin):
         n_param_search=30,
         n_probe_features=40,
         normalize=True,
+        halving_search=False,
+        solver="ECOS",
         **kwargs,
     ):
         """
@@ -42,6 +46,8 @@ class FRIBase(BaseEstimator, SelectorMixin):
         n_param_search : int
         n_probe_features : int
         normalize : bool
+        halving_search : bool
+        solver : str
         kwargs :
 
         Attributes
@@ -65,10 +71,12 @@ class FRIBase(BaseEstimator, SelectorMixin):
         self.problem_type = problem_type
         self.n_probe_features = n_probe_features
         self.n_param_search = n_param_search
-        self.random_state = check_random_state(random_state)
+        self.random_state = random_state
         self.n_jobs = n_jobs
         self.verbose = verbose
         self.normalize = normalize
+        self.halving_search = halving_search
+        self.solver = solver
 
         self.other_args = kwargs
         for k, v in kwargs.items():
@@ -99,7 +107,16 @@ class FRIBase(BaseEstimator, SelectorMixin):
         -------
         `FRIBase`
         """
+        # Solver errors are tolerated during bound computation, so check the solver name beforehand
+        self.solver_ = self.solver.upper()
+        if self.solver_ not in cvx.installed_solvers():
+            raise ValueError(
+                f"Solver '{self.solver}' is not available. Installed solvers are {cvx.installed_solvers()}."
+            )
+
         self.problem_object_ = self.problem_type(**self.other_args)
+        # Resolve the seed once per fit, so refitting with an int seed is reproducible
+        self.random_state_ = check_random_state(self.random_state)
         self.lupi_features_ = lupi_features
         self.n_samples_ = X.shape[0]
         self.n_features_ = X.shape[1] - lupi_features
@@ -113,11 +130,12 @@ class FRIBase(BaseEstimator, SelectorMixin):
             data,
             self.problem_object_,
             self.optim_model_,
-            self.random_state,
+            self.random_state_,
             self.n_probe_features,
             self.n_jobs,
             self.verbose,
             normalize=self.normalize,
+            solver=self.solver_,
         )
         if lupi_features == 0:
             (
@@ -151,11 +169,12 @@ class FRIBase(BaseEstimator, SelectorMixin):
             init_model_template,
             hyperparameters,
             data,
-            self.random_state,
+            self.random_state_,
             search_samples,
             self.n_jobs,
             self.verbose,
             lupi_features=lupi_features,
+            halving_search=self.halving_search,
             **kwargs,
         )
         return optimal_model, best_score
@@ -198,7 +217,7 @@ class FRIBase(BaseEstimator, SelectorMixin):
 
         """
         check_is_fitted(self, "allrel_prediction_")
-        return sum(self.allrel_prediction_)
+        return int(np.count_nonzero(self.allrel_prediction_))
 
     def _get_support_mask(self):
         """Method for SelectorMixin
@@ -38,6 +38,10 @@ class Relevance_CVXProblem(ABC):
         self._probeID = probeID
         self._feature_relevance = None
         self.isLowerBound = None
+        self._objective_kwargs = {}
+        self._signs = None
+        self._solved_relevance = None
+        self._solver = "ECOS"
 
         # General data
         self.current_feature = current_feature
@@ -46,14 +50,10 @@ class Relevance_CVXProblem(ABC):
 
         self.preprocessing_data(data, best_model_state)
 
-        # Initialize constraints
+        # Constraints are initialized lazily in the worker (see `solve`)
         self._constraints = []
         self._objective = None
         self.w = None
-        self._init_constraints(hyperparameters, best_model_constraints)
-
-        if self.preset_model is not None:
-            self._add_preset_constraints(self.preset_model, best_model_constraints)
 
         self.init_hyperparameters = hyperparameters
         self.init_model_constraints = best_model_constraints
@@ -63,7 +63,7 @@ class Relevance_CVXProblem(ABC):
         self.n = X.shape[0]
         self.d = X.shape[1]
         self.X = X
-        self.y = np.array(y)
+        self.y = np.asarray(y)
 
     @property
     def constraints(self):
@@ -79,7 +79,7 @@ class Relevance_CVXProblem(ABC):
     @property
     def solved_relevance(self):
         if self.is_solved:
-            return self.objective.value
+            return self._solved_relevance
         else:
             raise Exception("Problem not solved. No feature relevance computed.")
 
@@ -103,41 +103,89 @@ class Relevance_CVXProblem(ABC):
     def init_objective_LB(self, **kwargs):
         pass
 
+    def register_objective(self, isLowerBound, signs=None, **kwargs):
+        """
+        Store which bound is computed by this problem.
+        The objective itself is only created together with the constraints in `solve`.
+
+        Parameters
+        ----------
+        isLowerBound : bool
+        signs : list of int, optional
+            Candidate values for the `sign` argument of the objective.
+            The problem is built once with `sign` as `cvx.Parameter` and solved for each value,
+            the maximal relevance over all feasible candidates is kept.
+        kwargs :
+            Passed to `init_objective_LB` or `init_objective_UB`.
+        """
+        self.isLowerBound = isLowerBound
+        self._signs = signs
+        self._objective_kwargs = kwargs
+
+    def _init_problem(self):
+        self._constraints = []
+        self._init_constraints(self.init_hyperparameters, self.init_model_constraints)
+
+        if self.preset_model is not None:
+            self._add_preset_constraints(self.preset_model, self.init_model_constraints)
+
+        objective_kwargs = self._objective_kwargs
+        if self._signs is not None:
+            # Parametrized sign lets cvxpy reuse the canonicalization when re-solving (DPP)
+            self._sign = cvx.Parameter(name="sign")
+            objective_kwargs = dict(objective_kwargs, sign=self._sign)
+
+        if self.isLowerBound:
+            self.init_objective_LB(**objective_kwargs)
+        else:
+            self.init_objective_UB(**objective_kwargs)
+
     @property
     def cvx_problem(self):
         return self._cvx_problem
 
     @property
     def is_solved(self):
-        if self._solver_status in self.accepted_status:
-            try:
-                val = self.objective.value
-            except ValueError:
-                return False
-
-            return True
-        else:
-            return False
+        return self._solved_relevance is not None
 
     @property
     def accepted_status(self):
         return ["optimal", "optimal_inaccurate"]
 
-    def solve(self) -> object:
+    def solve(self, solver="ECOS") -> object:
         # We init cvx problem here because pickling LP solver objects is problematic
         # by deferring it to here, worker threads do the problem building themselves and we spare the serialization
+        # The same holds for constraints and objective: only the data arrays are sent to the worker
+        self._solver = solver
+        self._init_problem()
         self._cvx_problem = cvx.Problem(
             objective=self.objective, constraints=self.constraints
         )
-        try:
-            # print("Solve", self)
-            self._cvx_problem.solve(**self.solver_kwargs)
-        except SolverError:
-            # We ignore Solver Errors, which are common with our framework:
-            # We solve multiple problems per bound and choose a feasible solution later (see '_create_interval')
-            pass
-
-        self._solver_status = self._cvx_problem.status
+
+        # Solver options are the same for every sign, resolve them once
+        solver_kwargs = self.solver_kwargs
+        candidates = []
+        for i, sign in enumerate(self._signs or [None]):
+            if sign is not None:
+                self._sign.value = sign
+            try:
+                # print("Solve", self)
+                # Re-solves only differ in the sign parameter, start them from the previous solution
+                self._cvx_problem.solve(warm_start=i > 0, **solver_kwargs)
+            except SolverError:
+                # We ignore Solver Errors, which are common with our framework:
+                # We solve multiple problems per bound and choose a feasible solution later (see '_create_interval')
+                pass
+
+            self._solver_status = self._cvx_problem.status
+            if self._solver_status in self.accepted_status:
+                try:
+                    candidates.append(self.objective.value)
+                except ValueError:
+                    pass
+
+        if len(candidates) > 0:
+            self._solved_relevance = max(candidates)
         # self._cvx_problem = None
         return self
 
@@ -146,7 +194,10 @@ class Relevance_CVXProblem(ABC):
 
     @property
     def solver_kwargs(self):
-        return {"verbose": False, "solver": "ECOS", "max_iters": 300}
+        kwargs = {"verbose": False, "solver": self._solver}
+        if self._solver == "ECOS":
+            kwargs["max_iters"] = 300
+        return kwargs
 
     def _add_preset_constraints(self, preset_model: dict, best_model_constraints):
 
@@ -192,8 +243,7 @@ class Relevance_CVXProblem(ABC):
             best_model_state=best_model_state,
             probeID=probeID,
         )
-        problem.init_objective_LB()
-        problem.isLowerBound = True
+        problem.register_objective(isLowerBound=True)
         yield problem
 
     @classmethod
@@ -207,19 +257,17 @@ class Relevance_CVXProblem(ABC):
         preset_model,
         probeID=-1,
     ):
-        for sign in [-1, 1]:
-            problem = cls(
-                di,
-                data,
-                best_hyperparameters,
-                init_constraints,
-                preset_model=preset_model,
-                best_model_state=best_model_state,
-                probeID=probeID,
-            )
-            problem.init_objective_UB(sign=sign)
-            problem.isLowerBound = False
-            yield problem
+        problem = cls(
+            di,
+            data,
+            best_hyperparameters,
+            init_constraints,
+            preset_model=preset_model,
+            best_model_state=best_model_state,
+            probeID=probeID,
+        )
+        problem.register_objective(isLowerBound=False, signs=[-1, 1])
+        yield problem
 
     @classmethod
     def aggregate_min_candidates(cls, min_problems_candidates):
@@ -11,6 +11,14 @@ from fri.model.base_initmodel import InitModel
 from .base_type import ProblemType
 
 
+def fold_labels(y, X):
+    """Multiply each sample by its label.
+
+    Lets the margin y * (X @ w + b) be expressed as yX @ w + y * b.
+    """
+    return y[:, np.newaxis] * X
+
+
 class Classification(ProblemType):
     @classmethod
     def parameters(cls):
@@ -60,7 +68,8 @@ class Classification_SVM(InitModel):
         b = cvx.Variable(name="bias")
 
         objective = cvx.Minimize(cvx.norm(w, 1) + C * cvx.sum(slack))
-        constraints = [cvx.multiply(y.T, X @ w + b) >= 1 - slack, slack >= 0]
+        yX = fold_labels(y, X)
+        constraints = [yX @ w + y * b >= 1 - slack, slack >= 0]
 
         # Solve problem.
 
@@ -69,7 +78,7 @@ class Classification_SVM(InitModel):
 
         w = w.value
         b = b.value
-        slack = np.asarray(slack.value).flatten()
+        slack = np.ravel(slack.value)
         self.model_state = {"w": w, "b": b, "slack": slack}
 
         loss = np.sum(slack)
@@ -80,9 +89,7 @@ class Classification_SVM(InitModel):
     def predict(self, X):
         w = self.model_state["w"]
         b = self.model_state["b"]
-        y = np.dot(X, w) + b >= 0
-        y = y.astype(int)
-        y[y == 0] = -1
+        y = np.where(np.dot(X, w) + b >= 0, 1, -1)
         return y
 
     def score(self, X, y, **kwargs):
@@ -125,7 +132,8 @@ class Classification_Relevance_Bound(Relevance_CVXProblem):
         self.slack = cvx.Variable(shape=(self.n), nonneg=True, name="slack")
 
         # New Constraints
-        distance_from_plane = cvx.multiply(self.y, self.X @ self.w + self.b)
+        yX = fold_labels(self.y, self.X)
+        distance_from_plane = yX @ self.w + self.y * self.b
         self.loss = cvx.sum(self.slack)
         self.weight_norm = cvx.norm(self.w, 1)
 
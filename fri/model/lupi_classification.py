@@ -9,7 +9,7 @@ from sklearn.utils.multiclass import unique_labels
 from .base_initmodel import InitModel
 from .base_lupi import LUPI_Relevance_CVXProblem, split_dataset
 from .base_type import ProblemType
-from .classification import Classification_Relevance_Bound
+from .classification import Classification_Relevance_Bound, fold_labels
 
 
 class LUPI_Classification(ProblemType):
@@ -90,7 +90,6 @@ class LUPI_Classification_SVM(InitModel):
         if lupi_features is None:
             try:
                 lupi_features = self.lupi_features
-                self.lupi_features = lupi_features
             except:
                 raise ValueError("No amount of lupi features given.")
         X, X_priv = split_dataset(X_combined, self.lupi_features)
@@ -108,7 +107,8 @@ class LUPI_Classification_SVM(InitModel):
         b_priv = cvx.Variable(name="bias_priv")
 
         # Define functions for better readability
-        function = X @ w + b
+        yX = fold_labels(y, X)
+        signed_function = yX @ w + y * b
         priv_function = X_priv @ w_priv + b_priv
         slack = cvx.Variable(shape=(n))
 
@@ -121,7 +121,7 @@ class LUPI_Classification_SVM(InitModel):
         weight_regularization = 0.5 * (w_l1 + scaling_lupi_w * w_priv_l1)
 
         constraints = [
-            cvx.multiply(y.T, function) >= 1 - cvx.multiply(y.T, priv_function) - slack,
+            signed_function >= 1 - cvx.multiply(y, priv_function) - slack,
             priv_function >= 0,
             slack >= 0,
         ]
@@ -157,11 +157,9 @@ class LUPI_Classification_SVM(InitModel):
 
         # Simple hyperplane classification rule
         f = np.dot(X, w) + b
-        y = f >= 0
-        y = y.astype(int)
 
         # Format binary as signed unit vector
-        y[y == 0] = -1
+        y = np.where(f >= 0, 1, -1)
 
         return y
 
@@ -208,16 +206,15 @@ class LUPI_Classification_Relevance_Bound(
         slack = cvx.Variable(shape=(self.n))
 
         # New Constraints
-        function = cvx.multiply(self.y.T, self.X @ w + b)
+        yX = fold_labels(self.y, self.X)
+        function = yX @ w + self.y * b
         priv_function = self.X_priv @ w_priv + b_priv
         loss = cvx.sum(priv_function) + cvx.sum(slack)
 
         weight_norm = cvx.norm(w, 1)
         weight_norm_priv = cvx.norm(w_priv, 1)
 
-        self.add_constraint(
-            function >= 1 - cvx.multiply(self.y.T, priv_function) - slack
-        )
+        self.add_constraint(function >= 1 - cvx.multiply(self.y, priv_function) - slack)
         self.add_constraint(priv_function >= 0)
         self.add_constraint(loss <= init_loss)
         self.add_constraint(weight_norm + weight_norm_priv <= l1_w + l1_priv_w)
@@ -1,5 +1,3 @@
-from itertools import product
-
 import cvxpy as cvx
 import numpy as np
 from sklearn.metrics import make_scorer
@@ -12,6 +10,7 @@ from fri.model.base_lupi import (
 )
 from fri.model.ordinal_regression import (
     OrdinalRegression_Relevance_Bound,
+    get_bin_indices,
     ordinal_scores,
 )
 from .base_initmodel import LUPI_InitModel
@@ -88,7 +87,6 @@ class LUPI_OrdinalRegression_SVM(LUPI_InitModel):
         if lupi_features is None:
             try:
                 lupi_features = self.lupi_features
-                self.lupi_features = lupi_features
             except:
                 raise ValueError("No amount of lupi features given.")
         X, X_priv = split_dataset(X_combined, self.lupi_features)
@@ -108,8 +106,12 @@ class LUPI_OrdinalRegression_SVM(LUPI_InitModel):
         w_priv = cvx.Variable(shape=(self.lupi_features, 2), name="w_priv")
         d_priv = cvx.Variable(shape=(2), name="bias_priv")
 
+        bin_indices = get_bin_indices(
+            y, [get_original_bin_name[bin] for bin in range(n_bins)]
+        )
+
         def priv_function(bin, sign):
-            indices = np.where(y == get_original_bin_name[bin])
+            indices = bin_indices[bin]
             return X_priv[indices] @ w_priv[:, sign] + d_priv[sign]
 
         # L1 norm regularization of both functions with 1 scaling constant
@@ -123,21 +125,19 @@ class LUPI_OrdinalRegression_SVM(LUPI_InitModel):
         loss = 0
 
         for left_bin in range(0, n_bins - 1):
-            indices = np.where(y == get_original_bin_name[left_bin])
-            constraints.append(
-                X[indices] @ w - b_s[left_bin] <= -1 + priv_function(left_bin, 0)
-            )
-            constraints.append(priv_function(left_bin, 0) >= 0)
-            loss += cvx.sum(priv_function(left_bin, 0))
+            indices = bin_indices[left_bin]
+            priv_left = priv_function(left_bin, 0)
+            constraints.append(X[indices] @ w - b_s[left_bin] <= -1 + priv_left)
+            constraints.append(priv_left >= 0)
+            loss += cvx.sum(priv_left)
 
         # Add constraints for slack into right neighboring bins
         for right_bin in range(1, n_bins):
-            indices = np.where(y == get_original_bin_name[right_bin])
-            constraints.append(
-                X[indices] @ w - b_s[right_bin - 1] >= +1 - priv_function(right_bin, 1)
-            )
-            constraints.append(priv_function(right_bin, 1) >= 0)
-            loss += cvx.sum(priv_function(right_bin, 1))
+            indices = bin_indices[right_bin]
+            priv_right = priv_function(right_bin, 1)
+            constraints.append(X[indices] @ w - b_s[right_bin - 1] >= +1 - priv_right)
+            constraints.append(priv_right >= 0)
+            loss += cvx.sum(priv_right)
 
         for i_boundary in range(0, n_boundaries - 1):
             constraints.append(b_s[i_boundary] <= b_s[i_boundary + 1])
@@ -173,12 +173,11 @@ class LUPI_OrdinalRegression_SVM(LUPI_InitModel):
         w = self.model_state["w"]
         b_s = self.model_state["b_s"]
 
-        scores = np.dot(X, w.T)[np.newaxis]
-        bin_thresholds = np.append(b_s, np.inf)
+        scores = np.dot(X, w)
 
-        # If thresholds are smaller than score the value belongs to the bigger bin
-        # after subtracting we check for positive elements
-        indices = np.sum(scores.T - bin_thresholds >= 0, -1)
+        # Every threshold smaller or equal to the score moves the sample into the next bin.
+        # The thresholds are ordered by constraint, sorting only guards against solver inaccuracies
+        indices = np.searchsorted(np.sort(b_s), scores, side="right")
         return self.classes_[indices]
 
     def score(self, X, y, error_type="mmae", return_error=False, **kwargs):
@@ -212,10 +211,9 @@ def get_bin_mapping(y):
 
     """
     classes_ = np.unique(y)
-    original_bins = sorted(classes_)
-    n_bins = len(original_bins)
+    n_bins = len(classes_)
     bins = np.arange(n_bins)
-    get_old_bin = dict(zip(bins, original_bins))
+    get_old_bin = dict(zip(bins, classes_))
     return get_old_bin, n_bins
 
 
@@ -258,8 +256,7 @@ class LUPI_OrdinalRegression_Relevance_Bound(
                     best_model_state=best_model_state,
                     probeID=probeID,
                 )
-                problem.init_objective_LB(sign=sign)
-                problem.isLowerBound = True
+                problem.register_objective(isLowerBound=True, sign=sign)
                 yield problem
 
     @classmethod
@@ -288,7 +285,8 @@ class LUPI_OrdinalRegression_Relevance_Bound(
                 probeID=probeID,
             )
         else:
-            for sign, pos in product([1, -1], [0, 1]):
+            # Both signs share one problem per function, see `register_objective`
+            for pos in [0, 1]:
                 problem = cls(
                     di,
                     data,
@@ -298,7 +296,7 @@ class LUPI_OrdinalRegression_Relevance_Bound(
                     best_model_state=best_model_state,
                     probeID=probeID,
                 )
-                problem.init_objective_UB(sign=sign, pos=pos)
+                problem.register_objective(isLowerBound=False, signs=[1, -1], pos=pos)
                 yield problem
 
     @classmethod
@@ -342,8 +340,12 @@ class LUPI_OrdinalRegression_Relevance_Bound(
         w_priv = cvx.Variable(shape=(self.d_priv, 2), name="w_priv")
         d_priv = cvx.Variable(shape=(2), name="bias_priv")
 
+        bin_indices = get_bin_indices(
+            self.y, [get_original_bin_name[bin] for bin in range(n_bins)]
+        )
+
         def priv_function(bin, sign):
-            indices = np.where(self.y == get_original_bin_name[bin])
+            indices = bin_indices[bin]
             return self.X_priv[indices] @ w_priv[:, sign] + d_priv[sign]
 
         # L1 norm regularization of both functions with 1 scaling constant
@@ -354,22 +356,21 @@ class LUPI_OrdinalRegression_Relevance_Bound(
 
         loss = 0
         for left_bin in range(0, n_bins - 1):
-            indices = np.where(self.y == get_original_bin_name[left_bin])
-            self.add_constraint(
-                self.X[indices] @ w - b_s[left_bin] <= -1 + priv_function(left_bin, 0)
-            )
-            self.add_constraint(priv_function(left_bin, 0) >= 0)
-            loss += cvx.sum(priv_function(left_bin, 0))
+            indices = bin_indices[left_bin]
+            priv_left = priv_function(left_bin, 0)
+            self.add_constraint(self.X[indices] @ w - b_s[left_bin] <= -1 + priv_left)
+            self.add_constraint(priv_left >= 0)
+            loss += cvx.sum(priv_left)
 
         # Add constraints for slack into right neighboring bins
         for right_bin in range(1, n_bins):
-            indices = np.where(self.y == get_original_bin_name[right_bin])
+            indices = bin_indices[right_bin]
+            priv_right = priv_function(right_bin, 1)
             self.add_constraint(
-                self.X[indices] @ w - b_s[right_bin - 1]
-                >= +1 - priv_function(right_bin, 1)
+                self.X[indices] @ w - b_s[right_bin - 1] >= +1 - priv_right
             )
-            self.add_constraint(priv_function(right_bin, 1) >= 0)
-            loss += cvx.sum(priv_function(right_bin, 1))
+            self.add_constraint(priv_right >= 0)
+            loss += cvx.sum(priv_right)
 
         for i_boundary in range(0, n_boundaries - 1):
             self.add_constraint(b_s[i_boundary] <= b_s[i_boundary + 1])
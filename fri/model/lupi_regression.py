@@ -1,5 +1,3 @@
-from itertools import product
-
 import cvxpy as cvx
 import numpy as np
 from sklearn.metrics import r2_score
@@ -62,6 +60,7 @@ class LUPI_Regression(ProblemType):
 
 class LUPI_Regression_SVM(LUPI_InitModel):
     HYPERPARAMETER = ["C", "epsilon", "scaling_lupi_w", "scaling_lupi_loss"]
+    SOLVER_PARAMS = {"solver": "ECOS", "verbose": False}
 
     def __init__(
         self,
@@ -91,7 +90,6 @@ class LUPI_Regression_SVM(LUPI_InitModel):
         if lupi_features is None:
             try:
                 lupi_features = self.lupi_features
-                self.lupi_features = lupi_features
             except:
                 raise ValueError("No amount of lupi features given.")
         X, X_priv = split_dataset(X_combined, self.lupi_features)
@@ -176,10 +174,6 @@ class LUPI_Regression_SVM(LUPI_InitModel):
         }
         return self
 
-    @property
-    def SOLVER_PARAMS(cls):
-        return {"solver": "ECOS", "verbose": False}
-
     def predict(self, X):
         """
         Method to predict points using svm classification rule.
@@ -234,7 +228,8 @@ class LUPI_Regression_Relevance_Bound(
                 probeID=probeID,
             )
         else:
-            for sign, pos in product([1, -1], [True, False]):
+            # Both signs share one problem per function, see `register_objective`
+            for pos in [True, False]:
                 problem = cls(
                     di,
                     data,
@@ -244,7 +239,7 @@ class LUPI_Regression_Relevance_Bound(
                     best_model_state=best_model_state,
                     probeID=probeID,
                 )
-                problem.init_objective_UB(sign=sign, pos=pos)
+                problem.register_objective(isLowerBound=False, signs=[1, -1], pos=pos)
                 yield problem
 
     def _init_objective_LB_LUPI(self, **kwargs):
@@ -289,7 +284,7 @@ class LUPI_Regression_Relevance_Bound(
 
         priv_function_pos = self.X_priv @ w_priv_pos + b_priv_pos
         priv_function_neg = self.X_priv @ w_priv_neg + b_priv_neg
-        priv_loss = cvx.sum(priv_function_pos + priv_function_neg)
+        priv_loss = cvx.sum(priv_function_pos) + cvx.sum(priv_function_neg)
         loss = priv_loss + cvx.sum(slack)
         weight_norm = cvx.norm(w, 1)
         self.weight_norm_priv_pos = cvx.norm(w_priv_pos, 1)
@@ -49,10 +49,8 @@ class OrdinalRegression_SVM(InitModel):
         C = self.get_params()["C"]
 
         self.classes_ = np.unique(y)
-        original_bins = sorted(self.classes_)
-        n_bins = len(original_bins)
-        bins = np.arange(n_bins)
-        get_old_bin = dict(zip(bins, original_bins))
+        n_bins = len(self.classes_)
+        bin_indices = get_bin_indices(y, self.classes_)
 
         w = cvx.Variable(shape=(d), name="w")
         # For ordinal regression we use two slack variables, we observe the slack in both directions
@@ -61,17 +59,19 @@ class OrdinalRegression_SVM(InitModel):
         # We have an offset for every bin boundary
         b_s = cvx.Variable(shape=(n_bins - 1), name="bias")
 
-        objective = cvx.Minimize(cvx.norm(w, 1) + C * cvx.sum(slack_left + slack_right))
+        objective = cvx.Minimize(
+            cvx.norm(w, 1) + C * (cvx.sum(slack_left) + cvx.sum(slack_right))
+        )
         constraints = [slack_left >= 0, slack_right >= 0]
 
         # Add constraints for slack into left neighboring bins
         for i in range(n_bins - 1):
-            indices = np.where(y == get_old_bin[i])
+            indices = bin_indices[i]
             constraints.append(X[indices] @ w - slack_left[indices] <= b_s[i] - 1)
 
         # Add constraints for slack into right neighboring bins
         for i in range(1, n_bins):
-            indices = np.where(y == get_old_bin[i])
+            indices = bin_indices[i]
             constraints.append(X[indices] @ w + slack_right[indices] >= b_s[i - 1] + 1)
 
         # Add explicit constraint, that all bins are ascending
@@ -85,11 +85,11 @@ class OrdinalRegression_SVM(InitModel):
 
         w = w.value
         b_s = b_s.value
-        slack_left = np.asarray(slack_left.value).flatten()
-        slack_right = np.asarray(slack_right.value).flatten()
+        slack_left = np.ravel(slack_left.value)
+        slack_right = np.ravel(slack_right.value)
         self.model_state = {"w": w, "b_s": b_s, "slack": (slack_left, slack_right)}
 
-        loss = np.sum(slack_left + slack_right)
+        loss = slack_left.sum() + slack_right.sum()
         w_l1 = np.linalg.norm(w, ord=1)
         self.constraints = {"loss": loss, "w_l1": w_l1}
         return self
@@ -98,12 +98,11 @@ class OrdinalRegression_SVM(InitModel):
         w = self.model_state["w"]
         b_s = self.model_state["b_s"]
 
-        scores = np.dot(X, w.T)[np.newaxis]
-        bin_thresholds = np.append(b_s, np.inf)
+        scores = np.dot(X, w)
 
-        # If thresholds are smaller than score the value belongs to the bigger bin
-        # after subtracting we check for positive elements
-        indices = np.sum(scores.T - bin_thresholds >= 0, -1)
+        # Every threshold smaller or equal to the score moves the sample into the next bin.
+        # The thresholds are ordered by constraint, sorting only guards against solver inaccuracies
+        indices = np.searchsorted(np.sort(b_s), scores, side="right")
         return self.classes_[indices]
 
     def score(self, X, y, error_type="mmae", return_error=False, **kwargs):
@@ -124,6 +123,26 @@ class OrdinalRegression_SVM(InitModel):
         return scorer, "mmae"
 
 
+def get_bin_indices(y, bins):
+    """Indices of the samples belonging to each bin, found with a single sort of `y`.
+
+    Parameters
+    ----------
+    y : array of discrete values
+    bins : sorted array of bin values
+
+    Returns
+    -------
+    list
+        One ascending index array per bin, equal to `np.where(y == bin)[0]`
+    """
+    order = np.argsort(y, kind="stable")
+    sorted_y = y[order]
+    starts = np.searchsorted(sorted_y, bins, side="left")
+    ends = np.searchsorted(sorted_y, bins, side="right")
+    return [order[start:end] for start, end in zip(starts, ends)]
+
+
 def ordinal_scores(y, prediction, error_type, return_error=False):
     """Score function for ordinal problems.
 
@@ -174,15 +193,18 @@ def ordinal_scores(y, prediction, error_type, return_error=False):
 
     # Score based on macro-averaged mean absolute error
     elif error_type == "mmae":
-        sum = 0
-        for i in range(n_bins):
-            samples = y == i
-            n_samples = np.sum(samples)
-            if n_samples > 0:
-                bin_error = mae(prediction[samples], y[samples]) / n_samples
-                sum += bin_error
-
-        error = sum / n_bins
+        # Sum up the absolute errors and the sample counts of every bin in one pass each,
+        # labels which do not match a bin index are skipped
+        y = np.asarray(y)
+        in_bins = (y >= 0) & (y < n_bins) & (y == np.floor(y))
+        bins = y[in_bins].astype(int)
+        bin_sizes = np.bincount(bins, minlength=n_bins)
+        bin_errors = np.bincount(
+            bins, weights=np.abs(prediction - y)[in_bins], minlength=n_bins
+        )
+        filled = bin_sizes > 0
+
+        error = np.sum(bin_errors[filled] / bin_sizes[filled]) / n_bins
         score = (max_dist - error) / max_dist
     else:
         raise ValueError("error_type {} not available!'".format(error_type))
@@ -228,17 +250,18 @@ class OrdinalRegression_Relevance_Bound(Relevance_CVXProblem):
         self.b_s = cvx.Variable(shape=(n_bins - 1), name="bias")
 
         # New Constraints
-        self.loss = cvx.sum(self.slack_left + self.slack_right)
+        self.loss = cvx.sum(self.slack_left) + cvx.sum(self.slack_right)
         self.weight_norm = cvx.norm(self.w, 1)
 
+        bin_indices = get_bin_indices(self.y, np.arange(n_bins))
         for i in range(n_bins - 1):
-            indices = np.where(self.y == i)
+            indices = bin_indices[i]
             self.add_constraint(
                 self.X[indices] @ self.w - self.slack_left[indices] <= self.b_s[i] - 1
             )
 
         for i in range(1, n_bins):
-            indices = np.where(self.y == i)
+            indices = bin_indices[i]
             self.add_constraint(
                 self.X[indices] @ self.w + self.slack_right[indices]
                 >= self.b_s[i - 1] + 1
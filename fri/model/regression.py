@@ -61,7 +61,7 @@ class Regression_SVR(InitModel):
 
         w = w.value
         b = b.value
-        slack = np.asarray(slack.value).flatten()
+        slack = np.ravel(slack.value)
         self.model_state = {"w": w, "b": b, "slack": slack}
 
         loss = np.sum(slack)
@@ -4,6 +4,7 @@
     The sampling rate can be increased.
     The model with the best internally defined accuracy is picked.
     To increase robustness we use cross validation.
+    Optionally, successive halving is used to discard bad candidates early on subsets of the data.
 """
 import warnings
 
@@ -15,9 +16,11 @@ from pprint import pprint
 from typing import Tuple
 
 import numpy as np
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa
+from sklearn.model_selection import HalvingRandomSearchCV, RandomizedSearchCV
 
 from fri.model.base_initmodel import InitModel
+from fri.utils import worker_backend
 
 
 def find_best_model(
@@ -29,10 +32,11 @@ def find_best_model(
     n_jobs: int,
     verbose: int = 0,
     lupi_features=None,
+    halving_search: bool = False,
     kwargs: dict = None,
 ) -> Tuple[InitModel, float]:
     """
-    Search function which wraps `sklearns`  `RandomizedSearchCV` function.
+    Search function which wraps `sklearns`  `RandomizedSearchCV` or `HalvingRandomSearchCV` function.
     We use distributions and parameters defined in the `model_template`.
 
     Parameters
@@ -53,9 +57,16 @@ def find_best_model(
         Allows verbose output when `verbose>0`.
     lupi_features : int
         Amount of lupi_features
+    halving_search : bool
+        Use successive halving instead of evaluating all `n_iter` candidates on the full data.
+        Not supported for LUPI models.
     kwargs : dict
         Placeholder, dict to pass into fit functions.
     """
+    if halving_search and lupi_features > 0:
+        # Small halving subsets favor degenerate LUPI baselines whose relevance bounds are infeasible
+        raise ValueError("Parameter 'halving_search' is not supported for LUPI models.")
+
     if lupi_features > 0:
         model = model_template(lupi_features=lupi_features)
     else:
@@ -67,22 +78,38 @@ def find_best_model(
     else:
         refit = metric
 
-    searcher = RandomizedSearchCV(
-        model,
-        hyperparameters,
-        scoring=scorer,
-        random_state=random_state,
-        refit=refit,
-        cv=3,
-        n_iter=n_iter,
-        n_jobs=n_jobs,
-        error_score=np.nan,
-        verbose=verbose,
-    )
+    if halving_search:
+        # Halving only supports a single metric, we use the one otherwise used for refitting
+        if scorer is not None:
+            scorer = scorer[metric]
+        searcher = HalvingRandomSearchCV(
+            model,
+            hyperparameters,
+            scoring=scorer,
+            random_state=random_state,
+            cv=3,
+            n_candidates=n_iter,
+            n_jobs=n_jobs,
+            error_score=np.nan,
+            verbose=verbose,
+        )
+    else:
+        searcher = RandomizedSearchCV(
+            model,
+            hyperparameters,
+            scoring=scorer,
+            random_state=random_state,
+            refit=refit,
+            cv=3,
+            n_iter=n_iter,
+            n_jobs=n_jobs,
+            error_score=np.nan,
+            verbose=verbose,
+        )
 
     X, y = data
     # Ignore warnings for extremely bad model_state (when precision=0)
-    with warnings.catch_warnings():
+    with warnings.catch_warnings(), worker_backend():
         warnings.simplefilter("ignore")
         searcher.fit(X, y)
 
@@ -1,9 +1,12 @@
+import cvxpy
+import joblib
 import numpy as np
 import pytest
 from sklearn.utils import check_random_state
 
-from fri import FRI, NORMAL_MODELS, LUPI_MODELS
+from fri import FRI, NORMAL_MODELS, LUPI_MODELS, ProblemName
 from fri import quick_generate
+from fri.utils import worker_backend
 
 
 @pytest.fixture(scope="function")
@@ -36,3 +39,63 @@ def test_lupi_model(problem, random_state):
     model.fit(combined, y, lupi_features=X.shape[1])
 
     assert len(model.allrel_prediction_) == combined.shape[1]
+
+
+@pytest.mark.skipif(
+    "CLARABEL" not in cvxpy.installed_solvers(), reason="CLARABEL not installed"
+)
+@pytest.mark.parametrize("problem", NORMAL_MODELS)
+def test_solver_option(problem, random_state):
+    model = FRI(problem, random_state=random_state, solver="CLARABEL")
+
+    X, y = quick_generate(problem, random_state=random_state)
+
+    model.fit(X, y)
+
+    assert len(model.allrel_prediction_) == X.shape[1]
+
+
+@pytest.mark.parametrize(
+    "name, problem",
+    [
+        ("classification", ProblemName.CLASSIFICATION),
+        ("class", ProblemName.CLASSIFICATION),
+        ("regression", ProblemName.REGRESSION),
+        ("ordreg", ProblemName.ORDINALREGRESSION),
+        ("lupi_ordregression", ProblemName.LUPI_ORDREGRESSION),
+    ],
+)
+def test_problem_name_string(name, problem):
+    model = FRI(name)
+
+    assert model.problem_type is problem.value[0]
+
+
+@pytest.mark.parametrize("solver", ["CLARABELL", "not_a_solver"])
+def test_invalid_solver(solver, random_state):
+    model = FRI(ProblemName.CLASSIFICATION, random_state=random_state, solver=solver)
+
+    X, y = quick_generate(ProblemName.CLASSIFICATION, random_state=random_state)
+
+    with pytest.raises(ValueError):
+        model.fit(X, y)
+
+
+def test_solver_name_case_insensitive(random_state):
+    model = FRI(ProblemName.CLASSIFICATION, random_state=random_state, solver="ecos")
+
+    X, y = quick_generate(ProblemName.CLASSIFICATION, random_state=random_state)
+    model.fit(X, y)
+
+    assert model.solver_ == "ECOS"
+
+
+def test_worker_backend_keeps_sequential_default():
+    with worker_backend():
+        assert joblib.Parallel(n_jobs=None).n_jobs == 1
+
+
+def test_worker_backend_keeps_caller_backend():
+    with joblib.parallel_backend("threading"), worker_backend():
+        backend, _ = joblib.parallel.get_active_backend()
+        assert isinstance(backend, joblib.parallel.ThreadingBackend)
@@ -19,16 +19,12 @@ def test_model(problem, n_strong, n_weak, randomstate):
     n_samples = 300
     n_features = 8
 
-    if problem is "regression":
-        gen = genRegressionData
-        model = FRI(ProblemName.REGRESSION, random_state=randomstate, verbose=1)
-
-    elif problem is "classification":
-        gen = genClassificationData
-        model = FRI(ProblemName.CLASSIFICATION, random_state=randomstate, verbose=1)
-    elif problem is "ordreg":
-        gen = genOrdinalRegressionData
-        model = FRI(ProblemName.ORDINALREGRESSION, random_state=randomstate, verbose=1)
+    gen, problemName = {
+        "regression": (genRegressionData, ProblemName.REGRESSION),
+        "classification": (genClassificationData, ProblemName.CLASSIFICATION),
+        "ordreg": (genOrdinalRegressionData, ProblemName.ORDINALREGRESSION),
+    }[problem]
+    model = FRI(problemName, random_state=randomstate, verbose=1)
 
     if n_strong + n_weak == 0:
         with pytest.raises(ValueError):
@@ -64,7 +60,7 @@ def test_model(problem, n_strong, n_weak, randomstate):
         assert len(interval) == X.shape[1]
 
         # Check the score which should be good
-        if problem is not "ordreg":
+        if problem != "ordreg":
             assert model.score(X[:30], y[:30]) >= 0.8
 
         n_f = n_strong + n_weak  # Number of relevant features
@@ -100,6 +96,18 @@ def test_multiprocessing(randomstate):
     model.fit(X, y)
 
 
+def test_refit_with_int_seed(randomstate):
+    X, y = genClassificationData(
+        n_samples=100, n_features=4, n_redundant=2, n_strel=1, random_state=randomstate
+    )
+
+    model = FRI(ProblemName.CLASSIFICATION, random_state=123, n_param_search=5)
+    first_interval = model.fit(X, y).interval_.copy()
+    second_interval = model.fit(X, y).interval_
+
+    np.testing.assert_array_equal(first_interval, second_interval)
+
+
 def test_nonbinaryclasses(randomstate):
     n = 90
     d = 2
@@ -72,3 +72,27 @@ def test_lupi_model_correctness(problem, n_weak, randomstate):
     print(model.print_interval_with_class())
     assert len(model.allrel_prediction_) == X.shape[1] + X_priv.shape[1]
     assert len(interval) == X.shape[1] + X_priv.shape[1]
+
+
+def test_lupi_ordreg_negative_labels(randomstate):
+    X, X_priv, y = genLupiData(
+        fri.ProblemName.LUPI_ORDREGRESSION,
+        n_strel=1,
+        n_samples=100,
+        n_irrel=2,
+        n_repeated=0,
+        random_state=randomstate,
+    )
+    n_priv_features = X_priv.shape[1]
+    combined = np.hstack([X, X_priv])
+
+    model = FRI(
+        fri.ProblemName.LUPI_ORDREGRESSION,
+        random_state=randomstate,
+        n_param_search=10,
+        n_probe_features=10,
+        n_jobs=1,
+    )
+    model.fit(combined, y - 1, lupi_features=n_priv_features)
+
+    assert len(model.interval_) == combined.shape[1]
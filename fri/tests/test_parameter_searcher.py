@@ -49,3 +49,48 @@ def test_baseline_lupi(problem, n_weak, randomstate):
     )
 
     assert best_score > 0.5
+
+
+@pytest.mark.parametrize("problem", fri.NORMAL_MODELS)
+def test_baseline_halving(problem, randomstate):
+    template = problem.value[0]().get_initmodel_template
+    params = problem.value[0]().get_all_parameters()
+    X, y = fri.quick_generate(
+        problem, n_samples=300, n_features=4, n_strel=2, random_state=randomstate
+    )
+    X = StandardScaler().fit(X).transform(X)
+
+    best_model, best_score = find_best_model(
+        template,
+        params,
+        (X, y),
+        randomstate,
+        10,
+        n_jobs=1,
+        lupi_features=0,
+        halving_search=True,
+    )
+
+    assert best_score > 0.5
+
+
+@pytest.mark.parametrize("problem", fri.LUPI_MODELS)
+def test_baseline_halving_lupi(problem, randomstate):
+    template = problem.value[0]().get_initmodel_template
+    params = problem.value[0]().get_all_parameters()
+    X, X_priv, y = genLupiData(
+        problem, n_strel=1, n_samples=100, n_irrel=1, random_state=randomstate
+    )
+    combined = np.hstack([X, X_priv])
+
+    with pytest.raises(ValueError):
+        find_best_model(
+            template,
+            params,
+            (combined, y),
+            randomstate,
+            10,
+            n_jobs=1,
+            lupi_features=X_priv.shape[1],
+            halving_search=True,
+        )
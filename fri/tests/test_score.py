@@ -49,3 +49,10 @@ def test_score_imbalanced(data, imb_data):
     score_mmae = score(imb_data, swap_first_last(imb_data), error_type="mmae")
 
     assert score_mae != score_mmae
+
+
+def test_mmae_labels_outside_bins():
+    # Labels which are no bin index are skipped instead of failing
+    y = np.array([-1, 0, 1])
+    assert score(y, y, error_type="mmae") == 1
+    assert score(y, reverse_label(y), error_type="mmae") == pytest.approx(2 / 3)
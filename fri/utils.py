@@ -1,4 +1,9 @@
+import contextlib
+
+import joblib
 import numpy as np
+from joblib._parallel_backends import LokyBackend
+from joblib.parallel import get_active_backend
 
 
 def distance(u, v):
@@ -32,3 +37,22 @@ def permutate_feature_in_data(data, feature_i, random_state):
     # Add permutation back to dataset
     X_copy[:, feature_i] = permutated_feature
     return X_copy, y
+
+
+def worker_backend():
+    """
+    Parallel backend for our worker processes.
+    Each loky worker is limited to one thread (e.g. for BLAS) because the cores are already used by the `n_jobs` workers.
+    Other backends set up by the caller are left untouched.
+
+    Returns
+    -------
+    context manager
+    """
+    backend, n_jobs = get_active_backend()
+    if not isinstance(backend, LokyBackend):
+        return contextlib.nullcontext()
+    # Keep `n_jobs=None` sequential, `parallel_backend` would default it to all cores
+    if n_jobs is None:
+        n_jobs = 1
+    return joblib.parallel_backend("loky", n_jobs=n_jobs, inner_max_num_threads=1)